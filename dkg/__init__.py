@@ -1,3 +1,25 @@
-from . import providers  # NOQA: F401
-from . import utils  # NOQA: F401
-from .main import DKG  # NOQA: F401
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import providers  # NOQA: F401
+    from . import utils  # NOQA: F401
+    from .main import DKG  # NOQA: F401
+
+__all__ = ["DKG", "providers", "utils"]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "DKG":
+        from .main import DKG
+
+        return DKG
+
+    if name in ("providers", "utils"):
+        return import_module(f".{name}", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -15,7 +15,8 @@
 # specific language governing permissions and limitations
 # under the License.
 
-import json
+import asyncio
+import copy
 import math
 import re
 from typing import Literal, Type
@@ -28,10 +29,10 @@ from web3.types import TxReceipt
 
 from dkg.constants import (
     DEFAULT_HASH_FUNCTION_ID,
-    DEFAULT_PROXIMITY_SCORE_FUNCTIONS_PAIR_IDS,
     PRIVATE_ASSERTION_PREDICATE,
     PRIVATE_CURRENT_REPOSITORY,
     PRIVATE_HISTORICAL_REPOSITORY,
+    get_proximity_score_functions_pair_id,
 )
 from dkg.dataclasses import (
     BidSuggestionRange,
@@ -44,15 +45,18 @@ from dkg.exceptions import (
     InvalidKnowledgeAsset,
     InvalidStateOption,
     InvalidTokenAmount,
+    KnowledgeAssetBatchCreationFailed,
     MissingKnowledgeAssetState,
+    NodeRequestError,
+    OperationFailed,
     OperationNotFinished,
 )
 from dkg.manager import DefaultRequestManager
 from dkg.method import Method
 from dkg.module import Module
-from dkg.types import JSONLD, UAL, Address, AgreementData, HexStr, Wei
+from dkg.types import JSONLD, UAL, Address, AgreementData, HexStr, NQuads, Wei
 from dkg.utils.blockchain_request import BlockchainRequest
-from dkg.utils.decorators import retry
+from dkg.utils.decorators import retry_operation_result
 from dkg.utils.merkle import MerkleTree, hash_assertion_with_indexes
 from dkg.utils.metadata import (
     generate_agreement_id,
@@ -65,10 +69,27 @@ from dkg.utils.node_request import (
     StoreTypes,
     validate_operation_status,
 )
-from dkg.utils.rdf import format_content, normalize_dataset
+from dkg.utils.rdf import format_content, normalize_dataset, nquads_to_dataset
+from dkg.utils.receipt import receipt_to_dict
 from dkg.utils.ual import format_ual, parse_ual
 
 
+def _assertion_to_nquads(assertion: NQuads) -> str:
+    return "\n".join(assertion)
+
+
+def _assertion_to_jsonld(assertion: NQuads) -> list[JSONLD]:
+    return jsonld.from_rdf(nquads_to_dataset(assertion), {"algorithm": "URDNA2015"})
+
+
+_OUTPUT_FORMAT_HANDLERS = {
+    "NQUADS": _assertion_to_nquads,
+    "N-QUADS": _assertion_to_nquads,
+    "JSONLD": _assertion_to_jsonld,
+    "JSON-LD": _assertion_to_jsonld,
+}
+
+
 class KnowledgeAsset(Module):
     def __init__(self, manager: DefaultRequestManager):
         self.manager = manager
@@ -211,6 +232,86 @@ class KnowledgeAsset(Module):
         content_type: Literal["JSON-LD", "N-Quads"] = "JSON-LD",
         paranet_ual: UAL | None = None,
     ) -> dict[str, UAL | HexStr | dict[str, dict[str, str] | TxReceipt]]:
+        result, assertions_list = self._mint_and_publish(
+            content, epochs_number, token_amount, immutable, content_type, paranet_ual
+        )
+
+        if result["operation"]["publish"]["status"] == OperationStatus.COMPLETED:
+            result["operation"]["localStore"] = self._store_locally(assertions_list)
+
+        return result
+
+    def create_batch(
+        self,
+        contents: list[dict[Literal["public", "private"], JSONLD]],
+        epochs_number: int,
+        token_amount: Wei | None = None,
+        immutable: bool = False,
+        content_type: Literal["JSON-LD", "N-Quads"] = "JSON-LD",
+        paranet_ual: UAL | None = None,
+    ) -> list[dict[str, UAL | HexStr | dict[str, dict[str, str] | TxReceipt]]]:
+        results, assertions_list = [], []
+        for index, content in enumerate(contents):
+            try:
+                result, content_assertions_list = self._mint_and_publish(
+                    content,
+                    epochs_number,
+                    token_amount,
+                    immutable,
+                    content_type,
+                    paranet_ual,
+                )
+            except Exception as err:
+                self._store_batch_locally(results, assertions_list)
+                raise KnowledgeAssetBatchCreationFailed(
+                    f"Knowledge Asset {index} of the batch couldn't be created: {err}",
+                    results,
+                ) from err
+
+            results.append(result)
+
+            if result["operation"]["publish"]["status"] == OperationStatus.COMPLETED:
+                assertions_list.extend(content_assertions_list)
+
+        self._store_batch_locally(results, assertions_list)
+
+        return results
+
+    def _store_batch_locally(
+        self,
+        results: list[dict[str, UAL | HexStr | dict[str, dict[str, str] | TxReceipt]]],
+        assertions_list: list[dict[str, str | Address | NQuads]],
+    ) -> None:
+        if not assertions_list:
+            return
+
+        try:
+            local_store_operation = self._store_locally(assertions_list)
+        except (NodeRequestError, OperationFailed, OperationNotFinished) as err:
+            local_store_operation = {
+                "status": OperationStatus.FAILED.value,
+                "data": {
+                    "errorType": type(err).__name__,
+                    "errorMessage": str(err),
+                },
+            }
+
+        for result in results:
+            if result["operation"]["publish"]["status"] == OperationStatus.COMPLETED:
+                result["operation"]["localStore"] = copy.deepcopy(local_store_operation)
+
+    def _mint_and_publish(
+        self,
+        content: dict[Literal["public", "private"], JSONLD],
+        epochs_number: int,
+        token_amount: Wei | None,
+        immutable: bool,
+        content_type: Literal["JSON-LD", "N-Quads"],
+        paranet_ual: UAL | None,
+    ) -> tuple[
+        dict[str, UAL | HexStr | dict[str, dict[str, str] | TxReceipt]],
+        list[dict[str, str | Address | NQuads]],
+    ]:
         blockchain_id = self.manager.blockchain_provider.blockchain_id
         assertions = format_content(content, content_type)
 
@@ -253,9 +354,10 @@ class KnowledgeAsset(Module):
                         "chunksNumber": public_assertion_metadata["chunks_number"],
                         "tokenAmount": token_amount,
                         "epochsNumber": epochs_number,
-                        "scoreFunctionId": DEFAULT_PROXIMITY_SCORE_FUNCTIONS_PAIR_IDS[
-                            self.manager.blockchain_provider.environment
-                        ][blockchain_id],
+                        "scoreFunctionId": get_proximity_score_functions_pair_id(
+                            self.manager.blockchain_provider.environment,
+                            blockchain_id,
+                        ),
                         "immutable_": immutable,
                     }
                 )
@@ -276,9 +378,10 @@ class KnowledgeAsset(Module):
                         "chunksNumber": public_assertion_metadata["chunks_number"],
                         "tokenAmount": token_amount,
                         "epochsNumber": epochs_number,
-                        "scoreFunctionId": DEFAULT_PROXIMITY_SCORE_FUNCTIONS_PAIR_IDS[
-                            self.manager.blockchain_provider.environment
-                        ][blockchain_id],
+                        "scoreFunctionId": get_proximity_score_functions_pair_id(
+                            self.manager.blockchain_provider.environment,
+                            blockchain_id,
+                        ),
                         "immutable_": immutable,
                     },
                 )
@@ -307,7 +410,7 @@ class KnowledgeAsset(Module):
         result["UAL"] = format_ual(
             blockchain_id, content_asset_storage_address, token_id
         )
-        result["operation"]["mintKnowledgeAsset"] = json.loads(Web3.to_json(receipt))
+        result["operation"]["mintKnowledgeAsset"] = receipt_to_dict(receipt)
 
         assertions_list = [
             {
@@ -350,16 +453,21 @@ class KnowledgeAsset(Module):
             "status": operation_result["status"],
         }
 
-        if operation_result["status"] == OperationStatus.COMPLETED:
-            operation_id = self._local_store(assertions_list)["operationId"]
-            operation_result = self.get_operation_result(operation_id, "local-store")
+        return result, assertions_list
 
-            result["operation"]["localStore"] = {
-                "operationId": operation_id,
-                "status": operation_result["status"],
-            }
+    def _store_locally(
+        self, assertions_list: list[dict[str, str | Address | NQuads]]
+    ) -> dict[str, str]:
+        operation_id = self._local_store(assertions_list)["operationId"]
+        # Assertions are already submitted, don't keep them alive while polling
+        assertions_list.clear()
 
-        return result
+        operation_result = self.get_operation_result(operation_id, "local-store")
+
+        return {
+            "operationId": operation_id,
+            "status": operation_result["status"],
+        }
 
     _submit_knowledge_asset = Method(BlockchainRequest.submit_knowledge_asset)
 
@@ -394,7 +502,7 @@ class KnowledgeAsset(Module):
                     [knowledge_asset_storage, knowledge_asset_token_id],
                 )
             ),
-            "operation": json.loads(Web3.to_json(receipt)),
+            "operation": receipt_to_dict(receipt),
         }
 
     _transfer = Method(BlockchainRequest.transfer_asset)
@@ -415,7 +523,7 @@ class KnowledgeAsset(Module):
         return {
             "UAL": ual,
             "owner": new_owner,
-            "operation": json.loads(Web3.to_json(receipt)),
+            "operation": receipt_to_dict(receipt),
         }
 
     _update = Method(NodeRequest.update)
@@ -532,6 +640,8 @@ class KnowledgeAsset(Module):
             token_id,
             DEFAULT_HASH_FUNCTION_ID,
         )["operationId"]
+        del assertions, assertions_list
+
         operation_result = self.get_operation_result(operation_id, "update")
 
         return {
@@ -552,7 +662,7 @@ class KnowledgeAsset(Module):
 
         return {
             "UAL": ual,
-            "operation": json.loads(Web3.to_json(receipt)),
+            "operation": receipt_to_dict(receipt),
         }
 
     _burn_asset = Method(BlockchainRequest.burn_asset)
@@ -562,7 +672,7 @@ class KnowledgeAsset(Module):
 
         receipt: TxReceipt = self._burn_asset(token_id)
 
-        return {"UAL": ual, "operation": json.loads(Web3.to_json(receipt))}
+        return {"UAL": ual, "operation": receipt_to_dict(receipt)}
 
     _get_assertion_ids = Method(BlockchainRequest.get_assertion_ids)
     _get_latest_assertion_id = Method(BlockchainRequest.get_latest_assertion_id)
@@ -585,7 +695,10 @@ class KnowledgeAsset(Module):
             else state
         )
         content_visibility = content_visibility.upper()
-        output_format = output_format.upper()
+
+        format_assertion = _OUTPUT_FORMAT_HANDLERS.get(output_format.upper(), None)
+        if format_assertion is None:
+            raise DatasetOutputFormatNotSupported(f"{output_format} isn't supported!")
 
         token_id = parse_ual(ual)["token_id"]
 
@@ -645,14 +758,15 @@ class KnowledgeAsset(Module):
             case _:
                 raise InvalidStateOption(f"Invalid state option: {state}.")
 
-        get_public_operation_id: NodeResponseDict = self._get(
+        get_public_operation_id: str = self._get(
             ual, public_assertion_id, hashFunctionId=1
         )["operationId"]
 
         get_public_operation_result = self.get_operation_result(
             get_public_operation_id, "get"
         )
-        public_assertion = get_public_operation_result["data"].get("assertion", None)
+        get_public_operation_data = get_public_operation_result["data"]
+        public_assertion = get_public_operation_data.get("assertion", None)
 
         if public_assertion is None:
             raise MissingKnowledgeAssetState("Unable to find state on the network!")
@@ -668,26 +782,12 @@ class KnowledgeAsset(Module):
 
         result = {"operation": {}}
         if content_visibility != KnowledgeAssetContentVisibility.PRIVATE:
-            formatted_public_assertion = public_assertion
-
-            match output_format:
-                case "NQUADS" | "N-QUADS":
-                    formatted_public_assertion: list[JSONLD] = jsonld.from_rdf(
-                        "\n".join(public_assertion),
-                        {"algorithm": "URDNA2015", "format": "application/n-quads"},
-                    )
-                case "JSONLD" | "JSON-LD":
-                    formatted_public_assertion = "\n".join(public_assertion)
-
-                case _:
-                    raise DatasetOutputFormatNotSupported(
-                        f"{output_format} isn't supported!"
-                    )
+            formatted_public_assertion = format_assertion(public_assertion)
 
             if content_visibility == KnowledgeAssetContentVisibility.PUBLIC:
                 result = {
                     **result,
-                    "asertion": formatted_public_assertion,
+                    "assertion": formatted_public_assertion,
                     "assertionId": public_assertion_id,
                 }
             else:
@@ -702,23 +802,25 @@ class KnowledgeAsset(Module):
             }
 
         if content_visibility != KnowledgeAssetContentVisibility.PUBLIC:
-            private_assertion_link_triples = list(
-                filter(
-                    lambda element: PRIVATE_ASSERTION_PREDICATE in element,
-                    public_assertion,
-                )
+            private_assertion_link_triple = next(
+                (
+                    element
+                    for element in public_assertion
+                    if PRIVATE_ASSERTION_PREDICATE in element
+                ),
+                None,
             )
 
-            if private_assertion_link_triples:
+            if private_assertion_link_triple is not None:
                 private_assertion_id = re.search(
-                    r'"(.*?)"', private_assertion_link_triples[0]
+                    r'"(.*?)"', private_assertion_link_triple
                 ).group(1)
 
-                private_assertion = get_public_operation_result["data"].get(
+                private_assertion = get_public_operation_data.get(
                     "privateAssertion", None
                 )
 
-                query_private_operation_id: NodeResponseDict | None = None
+                query_private_operation_id: str | None = None
                 if private_assertion is None:
                     query = f"""
                     CONSTRUCT {{ ?s ?p ?o }}
@@ -760,24 +862,9 @@ class KnowledgeAsset(Module):
                                 f"Merkle Tree Root: {root}"
                             )
 
-                    match output_format:
-                        case "NQUADS" | "N-QUADS":
-                            formatted_private_assertion: list[JSONLD] = jsonld.from_rdf(
-                                "\n".join(private_assertion),
-                                {
-                                    "algorithm": "URDNA2015",
-                                    "format": "application/n-quads",
-                                },
-                            )
-                        case "JSONLD" | "JSON-LD":
-                            formatted_private_assertion = "\n".join(private_assertion)
-
-                        case _:
-                            raise DatasetOutputFormatNotSupported(
-                                f"{output_format} isn't supported!"
-                            )
+                    formatted_private_assertion = format_assertion(private_assertion)
 
-                    if content_visibility == KnowledgeAssetContentVisibility:
+                    if content_visibility == KnowledgeAssetContentVisibility.PRIVATE:
                         result = {
                             **result,
                             "assertion": formatted_private_assertion,
@@ -797,6 +884,33 @@ class KnowledgeAsset(Module):
 
         return result
 
+    async def aget(
+        self,
+        ual: UAL,
+        state: str | HexStr | int = KnowledgeAssetEnumStates.LATEST,
+        content_visibility: str = KnowledgeAssetContentVisibility.ALL,
+        output_format: Literal["JSON-LD", "N-Quads"] = "JSON-LD",
+        validate: bool = True,
+    ) -> dict[str, UAL | HexStr | list[JSONLD] | dict[str, str]]:
+        return await asyncio.to_thread(
+            self.get, ual, state, content_visibility, output_format, validate
+        )
+
+    async def get_many(
+        self,
+        uals: list[UAL],
+        state: str | HexStr | int = KnowledgeAssetEnumStates.LATEST,
+        content_visibility: str = KnowledgeAssetContentVisibility.ALL,
+        output_format: Literal["JSON-LD", "N-Quads"] = "JSON-LD",
+        validate: bool = True,
+    ) -> list[dict[str, UAL | HexStr | list[JSONLD] | dict[str, str]]]:
+        return await asyncio.gather(
+            *(
+                self.aget(ual, state, content_visibility, output_format, validate)
+                for ual in uals
+            )
+        )
+
     _extend_storing_period = Method(BlockchainRequest.extend_asset_storing_period)
 
     def extend_storing_period(
@@ -836,7 +950,7 @@ class KnowledgeAsset(Module):
 
         return {
             "UAL": ual,
-            "operation": json.loads(Web3.to_json(receipt)),
+            "operation": receipt_to_dict(receipt),
         }
 
     _get_assertion_size = Method(BlockchainRequest.get_assertion_size)
@@ -897,7 +1011,7 @@ class KnowledgeAsset(Module):
 
         return {
             "UAL": ual,
-            "operation": json.loads(Web3.to_json(receipt)),
+            "operation": receipt_to_dict(receipt),
         }
 
     _add_update_tokens = Method(BlockchainRequest.increase_asset_update_token_amount)
@@ -955,7 +1069,7 @@ class KnowledgeAsset(Module):
 
         return {
             "UAL": ual,
-            "operation": json.loads(Web3.to_json(receipt)),
+            "operation": receipt_to_dict(receipt),
         }
 
     def get_owner(self, ual: UAL) -> Address:
@@ -972,7 +1086,7 @@ class KnowledgeAsset(Module):
 
     _get_operation_result = Method(NodeRequest.get_operation_result)
 
-    @retry(catch=OperationNotFinished, max_retries=5, base_delay=1, backoff=2)
+    @retry_operation_result
     def get_operation_result(
         self, operation_id: str, operation: str
     ) -> NodeResponseDict:
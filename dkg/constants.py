@@ -15,77 +15,114 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import sys
+from types import MappingProxyType
+from typing import Any, Mapping
+
 PRIVATE_ASSERTION_PREDICATE = (
     "https://ontology.origintrail.io/dkg/1.0#privateAssertionID"
 )
 
-BLOCKCHAINS = {
-    "development": {
-        "hardhat1:31337": {
-            "hub": "0x5FbDB2315678afecb367f032d93F642f64180aa3",
-            "rpc": "http://localhost:8545",
-        },
-        "hardhat2:31337": {
-            "hub": "0x5FbDB2315678afecb367f032d93F642f64180aa3",
-            "rpc": "http://localhost:9545",
-        },
-    },
-    "devnet": {
-        "otp:2160": {
-            "hub": "0x833048F6e6BEa78E0AAdedeCd2Dc2231dda443FB",
-            "rpc": "https://lofar-tm-rpc.origin-trail.network",
-        },
-        "gnosis:10200": {
-            "hub": "0xD2bA102A0b11944d00180eE8136208ccF87bC39A",
-            "rpc": "https://rpc.chiadochain.net",
-            "gas_price_oracle": "https://blockscout.chiadochain.net/api/v1/gas-price-oracle",
-        },
-        "base:84532": {
-            "hub": "0x6C861Cb69300C34DfeF674F7C00E734e840C29C0",
-            "rpc": "https://sepolia.base.org",
-        },
-    },
-    "testnet": {
-        "otp:20430": {
-            "hub": "0xBbfF7Ea6b2Addc1f38A0798329e12C08f03750A6",
-            "rpc": "https://lofar-testnet.origin-trail.network",
-        },
-        "gnosis:10200": {
-            "hub": "0xC06210312C9217A0EdF67453618F5eB96668679A",
-            "rpc": "https://rpc.chiadochain.net",
-            "gas_price_oracle": "https://blockscout.chiadochain.net/api/v1/gas-price-oracle",
-        },
-        "base:84532": {
-            "hub": "0x144eDa5cbf8926327cb2cceef168A121F0E4A299",
-            "rpc": "https://sepolia.base.org",
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType(
+            {_freeze(key): _freeze(item) for key, item in value.items()}
+        )
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+BLOCKCHAINS: Mapping[str, Mapping[str, Mapping[str, Any]]] = _freeze(
+    {
+        "development": {
+            "hardhat1:31337": {
+                "hub": "0x5FbDB2315678afecb367f032d93F642f64180aa3",
+                "rpc": "http://localhost:8545",
+            },
+            "hardhat2:31337": {
+                "hub": "0x5FbDB2315678afecb367f032d93F642f64180aa3",
+                "rpc": "http://localhost:9545",
+            },
         },
-    },
-    "mainnet": {
-        "otp:2043": {
-            "hub": "0x5fA7916c48Fe6D5F1738d12Ad234b78c90B4cAdA",
-            "rpc": "https://astrosat-parachain-rpc.origin-trail.network",
+        "devnet": {
+            "otp:2160": {
+                "hub": "0x833048F6e6BEa78E0AAdedeCd2Dc2231dda443FB",
+                "rpc": "https://lofar-tm-rpc.origin-trail.network",
+            },
+            "gnosis:10200": {
+                "hub": "0xD2bA102A0b11944d00180eE8136208ccF87bC39A",
+                "rpc": "https://rpc.chiadochain.net",
+                "gas_price_oracle": "https://blockscout.chiadochain.net/api/v1/gas-price-oracle",
+            },
+            "base:84532": {
+                "hub": "0x6C861Cb69300C34DfeF674F7C00E734e840C29C0",
+                "rpc": "https://sepolia.base.org",
+            },
         },
-        "gnosis:100": {
-            "hub": "0xbEF14fc04F870c2dD65c13Df4faB6ba01A9c746b",
-            "rpc": "https://rpc.gnosischain.com/",
-            "gas_price_oracle": [
-                "https://api.gnosisscan.io/api?module=proxy&action=eth_gasPrice",
-                "https://blockscout.com/xdai/mainnet/api/v1/gas-price-oracle",
-            ],
+        "testnet": {
+            "otp:20430": {
+                "hub": "0xBbfF7Ea6b2Addc1f38A0798329e12C08f03750A6",
+                "rpc": "https://lofar-testnet.origin-trail.network",
+            },
+            "gnosis:10200": {
+                "hub": "0xC06210312C9217A0EdF67453618F5eB96668679A",
+                "rpc": "https://rpc.chiadochain.net",
+                "gas_price_oracle": "https://blockscout.chiadochain.net/api/v1/gas-price-oracle",
+            },
+            "base:84532": {
+                "hub": "0x144eDa5cbf8926327cb2cceef168A121F0E4A299",
+                "rpc": "https://sepolia.base.org",
+            },
         },
-        "base:8453": {
-            "hub": "0xaBfcf2ad1718828E7D3ec20435b0d0b5EAfbDf2c",
-            "rpc": "https://mainnet.base.org",
+        "mainnet": {
+            "otp:2043": {
+                "hub": "0x5fA7916c48Fe6D5F1738d12Ad234b78c90B4cAdA",
+                "rpc": "https://astrosat-parachain-rpc.origin-trail.network",
+            },
+            "gnosis:100": {
+                "hub": "0xbEF14fc04F870c2dD65c13Df4faB6ba01A9c746b",
+                "rpc": "https://rpc.gnosischain.com/",
+                "gas_price_oracle": [
+                    "https://api.gnosisscan.io/api?module=proxy&action=eth_gasPrice",
+                    "https://blockscout.com/xdai/mainnet/api/v1/gas-price-oracle",
+                ],
+            },
+            "base:8453": {
+                "hub": "0xaBfcf2ad1718828E7D3ec20435b0d0b5EAfbDf2c",
+                "rpc": "https://mainnet.base.org",
+            },
         },
-    },
+    }
+)
+
+_BLOCKCHAINS_FLAT: dict[tuple[str, str], Mapping[str, Any]] = {
+    (environment, blockchain_id): blockchain
+    for environment, blockchains in BLOCKCHAINS.items()
+    for blockchain_id, blockchain in blockchains.items()
 }
 
+
+def get_blockchain(environment: str, blockchain_id: str) -> Mapping[str, Any] | None:
+    return _BLOCKCHAINS_FLAT.get((environment, blockchain_id))
+
+
 DEFAULT_GAS_PRICE_GWEI = {
     "otp": 1,
     "gnosis": 20,
     "base": 20,
 }
 
+DEFAULT_RECEIPT_POLL_LATENCY = 0.1
+RECEIPT_POLL_LATENCY = {
+    "otp": 2,
+    "gnosis": 1,
+    "base": 0.5,
+}
+
 DEFAULT_HASH_FUNCTION_ID = 1
 DEFAULT_PROXIMITY_SCORE_FUNCTIONS_PAIR_IDS = {
     "development": {"hardhat1:31337": 2, "hardhat2:31337": 2, "otp:2043": 2},
@@ -106,6 +143,17 @@ DEFAULT_PROXIMITY_SCORE_FUNCTIONS_PAIR_IDS = {
     },
 }
 
+_PROXIMITY_SCORE_FUNCTIONS_PAIR_IDS_FLAT: dict[tuple[str, str], int] = {
+    (sys.intern(environment), sys.intern(blockchain_id)): pair_id
+    for environment, pair_ids in DEFAULT_PROXIMITY_SCORE_FUNCTIONS_PAIR_IDS.items()
+    for blockchain_id, pair_id in pair_ids.items()
+}
+
+
+def get_proximity_score_functions_pair_id(environment: str, blockchain_id: str) -> int:
+    return _PROXIMITY_SCORE_FUNCTIONS_PAIR_IDS_FLAT[(environment, blockchain_id)]
+
+
 PRIVATE_HISTORICAL_REPOSITORY = "privateHistory"
 PRIVATE_CURRENT_REPOSITORY = "privateCurrent"
 
@@ -16,24 +16,30 @@
 # under the License.
 
 from dataclasses import dataclass
-from enum import auto, Enum
-
-import pandas as pd
+from enum import auto, Enum, IntEnum
+from typing import TYPE_CHECKING
 
 from dkg.types import AutoStrEnum, AutoStrEnumCapitalize, AutoStrEnumUpperCase
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class BlockchainResponseDict(dict):
-    pass
+    __slots__ = ()
 
 
-class HTTPRequestMethod(Enum):
+class HTTPRequestMethod(IntEnum):
     GET = 1
     POST = 2
 
 
 class NodeResponseDict(dict):
-    def to_dataframe(self) -> pd.DataFrame:
+    __slots__ = ()
+
+    def to_dataframe(self) -> "pd.DataFrame":
+        import pandas as pd
+
         return pd.DataFrame(self)
 
 
@@ -55,12 +61,12 @@ class KnowledgeAssetContentVisibility(AutoStrEnumUpperCase):
     PRIVATE = auto()
 
 
-class ParanetIncentivizationType(Enum):
+class ParanetIncentivizationType(str, Enum):
     NEUROWEB = "Neuroweb"
     NEUROWEB_ERC20 = "NeurowebERC20"
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseIncentivesPoolParams:
     def to_contract_args(self) -> dict:
         raise NotImplementedError("This method should be overridden in subclasses")
@@ -33,15 +33,17 @@ class EnvironmentNotSupported(DKGException):
     Raised when blockchain provider is initialized for unsupported environment.
     """
 
-    pass
-
 
 class RPCURINotDefined(DKGException):
     """
     Raised when blockchain provider is initialized without RPC URI defined.
     """
 
-    pass
+
+class RPCEndpointsUnavailable(DKGException):
+    """
+    Raised when every configured RPC endpoint is rate limited or unreachable.
+    """
 
 
 class NetworkNotSupported(DKGException):
@@ -49,32 +51,24 @@ class NetworkNotSupported(DKGException):
     Raised when blockchain provider is initialized for unsupported network.
     """
 
-    pass
-
 
 class InvalidStateOption(DKGException):
     """
     Raised when invalid state option given to the get operation.
     """
 
-    pass
-
 
 class MissingKnowledgeAssetState(DKGException):
     """
     Raised when search for the Knowledge Asset state on the network has failed.
     """
 
-    pass
-
 
 class ValidationError(DKGException):
     """
     Raised when something does not pass a validation check.
     """
 
-    pass
-
 
 class InvalidRequest(DKGException):
     """
@@ -82,40 +76,30 @@ class InvalidRequest(DKGException):
     doesn't exist.
     """
 
-    pass
-
 
 class HTTPRequestMethodNotSupported(DKGException):
     """
     Raised if used HTTP method isn't supported
     """
 
-    pass
-
 
 class NodeRequestError(DKGException):
     """
     Raised by Node HTTP Provider if error occurred during request.
     """
 
-    pass
-
 
 class OperationNotFinished(DKGException):
     """
     Raised when requested operation result isn't ready.
     """
 
-    pass
-
 
 class OperationFailed(DKGException):
     """
     Raised when requested operation status is failed.
     """
 
-    pass
-
 
 class AccountMissing(DKGException):
     """
@@ -123,32 +107,24 @@ class AccountMissing(DKGException):
     specified.
     """
 
-    pass
-
 
 class InvalidDataset(DKGException):
     """
     Raised when dataset URDNA2015 normalization doesn't result in any quads.
     """
 
-    pass
-
 
 class DatasetInputFormatNotSupported(DKGException):
     """
     Raised when trying to normalize RDF dataset with not supported input format.
     """
 
-    pass
-
 
 class DatasetOutputFormatNotSupported(DKGException):
     """
     Raised when trying to convert RDF dataset to not supported output format.
     """
 
-    pass
-
 
 class InvalidKnowledgeAsset(DKGException):
     """
@@ -156,8 +132,6 @@ class InvalidKnowledgeAsset(DKGException):
     assertionId.
     """
 
-    pass
-
 
 class InvalidTokenAmount(DKGException):
     """
@@ -165,7 +139,16 @@ class InvalidTokenAmount(DKGException):
     or equal to what is already present in the contract.
     """
 
-    pass
+
+class KnowledgeAssetBatchCreationFailed(DKGException):
+    """
+    Raised when a Knowledge Asset in a batch can't be created. Results of the Knowledge
+    Assets created before it are available in the results attribute.
+    """
+
+    def __init__(self, message: str, results: list[dict]):
+        super().__init__(message)
+        self.results = results
 
 
 class LeafNotInTree(DKGException):
@@ -173,5 +156,3 @@ class LeafNotInTree(DKGException):
     Raised when proof/verification requested for the leaf that is not the part of the
     Merkle Tree.
     """
-
-    pass
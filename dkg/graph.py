@@ -15,17 +15,45 @@
 # specific language governing permissions and limitations
 # under the License.
 
-from rdflib.plugins.sparql.parser import parseQuery
+import asyncio
+import re
+from functools import lru_cache
 
 from dkg.dataclasses import NodeResponseDict
-from dkg.exceptions import OperationNotFinished
 from dkg.manager import DefaultRequestManager
 from dkg.method import Method
 from dkg.module import Module
 from dkg.types import NQuads
-from dkg.utils.decorators import retry
+from dkg.utils.decorators import retry_operation_result
 from dkg.utils.node_request import NodeRequest, validate_operation_status
 
+_QUERY_TYPE_PATTERN = re.compile(
+    r"^\s*(?:#[^\n]*\n\s*|PREFIX\s+\S*\s*<[^>]*>\s*|BASE\s*<[^>]*>\s*)*"
+    r"(?P<type>SELECT|CONSTRUCT|ASK|DESCRIBE)\b",
+    re.I,
+)
+
+_QUERY_NAME_MAP = {
+    "SelectQuery": "SELECT",
+    "ConstructQuery": "CONSTRUCT",
+    "AskQuery": "ASK",
+    "DescribeQuery": "DESCRIBE",
+}
+
+
+def _query_type_for(query: str) -> str:
+    if (match := _QUERY_TYPE_PATTERN.match(query)) is not None:
+        return match.group("type").upper()
+
+    return _parsed_query_type_for(query)
+
+
+@lru_cache(maxsize=512)
+def _parsed_query_type_for(query: str) -> str:
+    from rdflib.plugins.sparql.parser import parseQuery
+
+    return _QUERY_NAME_MAP[parseQuery(query)[1].name]
+
 
 class Graph(Module):
     def __init__(self, manager: DefaultRequestManager):
@@ -39,17 +67,38 @@ class Graph(Module):
         query: str,
         repository: str,
     ) -> NQuads:
-        parsed_query = parseQuery(query)
-        query_type = parsed_query[1].name.replace("Query", "").upper()
+        query_type = _query_type_for(query)
 
-        operation_id: NodeResponseDict = self._query(query, query_type, repository)[
-            "operationId"
-        ]
+        operation_id: str = self._query(query, query_type, repository)["operationId"]
         operation_result = self.get_operation_result(operation_id, "query")
 
         return operation_result["data"]
 
-    @retry(catch=OperationNotFinished, max_retries=5, base_delay=1, backoff=2)
+    async def aquery(
+        self,
+        query: str,
+        repository: str,
+    ) -> NQuads:
+        query_type = _query_type_for(query)
+
+        operation_id: str = (
+            await asyncio.to_thread(self._query, query, query_type, repository)
+        )["operationId"]
+        operation_result = await self.aget_operation_result(operation_id, "query")
+
+        return operation_result["data"]
+
+    async def batch_query(self, queries: list[tuple[str, str]]) -> list[NQuads]:
+        in_flight: dict[tuple[str, str], asyncio.Future] = {}
+        for query, repository in queries:
+            if (query, repository) not in in_flight:
+                in_flight[(query, repository)] = asyncio.ensure_future(
+                    self.aquery(query, repository)
+                )
+
+        return await asyncio.gather(*(in_flight[query] for query in queries))
+
+    @retry_operation_result
     def get_operation_result(
         self, operation_id: str, operation: str
     ) -> NodeResponseDict:
@@ -61,3 +110,15 @@ class Graph(Module):
         validate_operation_status(operation_result)
 
         return operation_result
+
+    @retry_operation_result
+    async def aget_operation_result(
+        self, operation_id: str, operation: str
+    ) -> NodeResponseDict:
+        operation_result = await asyncio.to_thread(
+            self._get_operation_result, operation_id=operation_id, operation=operation
+        )
+
+        validate_operation_status(operation_result)
+
+        return operation_result
@@ -15,7 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 
-from typing import Any, Type
+from typing import Any, Callable, Type
 
 from dkg.dataclasses import BlockchainResponseDict, NodeResponseDict
 from dkg.exceptions import InvalidRequest
@@ -52,13 +52,37 @@ class DefaultRequestManager:
         request_type: Type[JSONRPCRequest | ContractInteraction | NodeCall],
         request_params: dict[str, Any],
     ) -> BlockchainResponseDict | NodeResponseDict:
-        if issubclass(request_type, JSONRPCRequest):
-            return self.blockchain_provider.make_json_rpc_request(**request_params)
-        elif issubclass(request_type, ContractInteraction):
-            return self.blockchain_provider.call_function(**request_params)
-        elif issubclass(request_type, NodeCall):
-            return self.node_provider.make_request(**request_params)
-        else:
-            raise InvalidRequest(
-                "Invalid Request. Manager can only process Blockchain/Node requests."
+        handler = _REQUEST_HANDLERS.get(request_type, None)
+
+        if handler is None:
+            handler = next(
+                (
+                    _REQUEST_HANDLERS[base]
+                    for base in request_type.__mro__
+                    if base in _REQUEST_HANDLERS
+                ),
+                None,
             )
+            if handler is None:
+                raise InvalidRequest(
+                    "Invalid Request. Manager can only process Blockchain/Node "
+                    "requests."
+                )
+            _REQUEST_HANDLERS[request_type] = handler
+
+        return handler(self, request_params)
+
+
+_REQUEST_HANDLERS: dict[
+    Type, Callable[[DefaultRequestManager, dict[str, Any]], Any]
+] = {
+    JSONRPCRequest: lambda manager, request_params: (
+        manager.blockchain_provider.make_json_rpc_request(**request_params)
+    ),
+    ContractInteraction: lambda manager, request_params: (
+        manager.blockchain_provider.call_function(**request_params)
+    ),
+    NodeCall: lambda manager, request_params: (
+        manager.node_provider.make_request(**request_params)
+    ),
+}
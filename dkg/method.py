@@ -16,7 +16,7 @@
 # under the License.
 
 import itertools
-import re
+from string import Formatter
 from typing import TYPE_CHECKING, Any, Generic, Type
 
 from dkg.exceptions import ValidationError
@@ -36,6 +36,42 @@ if TYPE_CHECKING:
 class Method(Generic[TFunc]):
     def __init__(self, action: JSONRPCRequest | ContractInteraction | NodeCall):
         self.action = action
+        self.request_type = type(action)
+        self.name: str | None = None
+
+        if isinstance(action, NodeCall):
+            self.path_segments: list[tuple[str, str | None]] = [
+                (literal_text, field_name)
+                for literal_text, field_name, _, _ in Formatter().parse(action.path)
+            ]
+            self.path_placeholders: list[str] = [
+                field_name
+                for _, field_name in self.path_segments
+                if field_name is not None
+            ]
+            self.static_path: str | None = (
+                None
+                if self.path_placeholders
+                else "".join(literal_text for literal_text, _ in self.path_segments)
+            )
+
+        match action:
+            case JSONRPCRequest():
+                self._process_args = self._process_json_rpc_args
+            case ContractInteraction():
+                self._process_args = self._process_contract_interaction_args
+                self.state_changing = isinstance(action, ContractTransaction)
+            case NodeCall():
+                self._process_args = self._process_node_call_args
+            case _:
+                self._process_args = lambda args, kwargs: {}
+
+        self._constant_processed_args: dict[str, Any] | None = None
+        if self._takes_no_arguments():
+            self._constant_processed_args = self.process_args()
+
+    def __set_name__(self, owner: Type["Module"], name: str) -> None:
+        self.name = name
 
     def __get__(
         self, obj: "Module | None" = None, _: Type["Module"] | None = None
@@ -46,30 +82,55 @@ class Method(Generic[TFunc]):
                 "Methods must be called from a module instance, "
                 "usually attached to a dkg instance."
             )
-        return obj.retrieve_caller_fn(self)
+
+        caller = obj.retrieve_caller_fn(self)
+        if self.name is not None:
+            obj.__dict__[self.name] = caller
+
+        return caller
 
     def process_args(self, *args: Any, **kwargs: Any):
+        if not (args or kwargs) and self._constant_processed_args is not None:
+            return self._constant_processed_args
+
+        return self._process_args(args, kwargs)
+
+    def _process_json_rpc_args(
+        self, args: list[Any], kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        return {"args": self._validate_and_map(self.action.args, args, kwargs)}
+
+    def _process_contract_interaction_args(
+        self, args: list[Any], kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        action = self.action
+
+        contract = kwargs.pop("contract", None)
+        if action.contract:
+            contract = action.contract
+        elif not contract:
+            raise ValidationError(
+                "ContractInteraction requires a 'contract' to be provided"
+            )
+
+        return {
+            "contract": contract,
+            "args": self._validate_and_map(action.args, args, kwargs),
+            "state_changing": self.state_changing,
+        }
+
+    def _takes_no_arguments(self) -> bool:
         match self.action:
             case JSONRPCRequest():
-                return {"args": self._validate_and_map(self.action.args, args, kwargs)}
+                return self.action.args == {}
             case ContractInteraction():
-                contract = kwargs.pop("contract", None)
-                if not self.action.contract:
-                    if contract:
-                        self.action.contract = contract
-                    else:
-                        raise ValidationError(
-                            "ContractInteraction requires a 'contract' to be provided"
-                        )
-
-                return {
-                    "args": self._validate_and_map(self.action.args, args, kwargs),
-                    "state_changing": isinstance(self.action, ContractTransaction),
-                }
+                return bool(self.action.contract) and self.action.args == {}
             case NodeCall():
-                return self._process_node_call_args(args, kwargs)
+                return not (
+                    self.path_placeholders or self.action.params or self.action.data
+                )
             case _:
-                return {}
+                return False
 
     def _validate_and_map(
         self,
@@ -84,7 +145,7 @@ class Method(Generic[TFunc]):
             if len(args) == 1:
                 return args[0]
             else:
-                return list(kwargs.values())[0]
+                return next(iter(kwargs.values()))
 
         if len(args) > len(required_args):
             raise ValidationError(
@@ -92,16 +153,25 @@ class Method(Generic[TFunc]):
                 "number of required arguments"
             )
 
-        args_mapped = dict(zip(itertools.islice(required_args.keys(), len(args)), args))
-        camel_kwargs = {snake_to_camel(key): value for key, value in kwargs.items()}
+        if not kwargs:
+            if len(args) == len(required_args):
+                return dict(zip(required_args, args))
 
-        processed_args = {}
-        processed_args.update(args_mapped)
-        processed_args.update(camel_kwargs)
+            raise ValidationError(
+                "Missing required arg(s): "
+                f"{', '.join(itertools.islice(required_args, len(args), None))}"
+            )
 
-        if any(missing_params := (arg not in processed_args for arg in required_args)):
+        processed_args = dict(zip(required_args, args))
+        processed_args.update(
+            (key if "_" not in key else snake_to_camel(key), value)
+            for key, value in kwargs.items()
+        )
+
+        if missing_params := required_args.keys() - processed_args.keys():
             raise ValidationError(
-                f"Missing required arg(s): {', '.join(missing_params)}"
+                "Missing required arg(s): "
+                f"{', '.join(arg for arg in required_args if arg in missing_params)}"
             )
 
         return processed_args
@@ -109,39 +179,48 @@ class Method(Generic[TFunc]):
     def _process_node_call_args(
         self, args: list[Any], kwargs: dict[str, Any]
     ) -> dict[str, Any]:
-        path_placeholders = re.findall(r"\{([^{}]+)?\}", self.action.path)
+        params, data = self.action.params, self.action.data
+
+        if self.static_path is not None:
+            return {
+                "path": self.static_path,
+                "params": self._validate_and_map(params, args, kwargs)
+                if params
+                else {},
+                "data": self._validate_and_map(data, args, kwargs) if data else {},
+            }
 
         args_in_path = 0
-        path_args = []
-        path_kwargs = {}
-        if len(path_placeholders) > 0:
-            for placeholder in path_placeholders:
-                if (placeholder != "") and (placeholder in kwargs.keys()):
-                    path_kwargs[placeholder] = kwargs.pop(placeholder)
-                else:
-                    if len(args) <= args_in_path:
-                        raise ValidationError(
-                            "Number of given arguments can't be smaller than "
-                            "number of path placeholders"
-                        )
-
-                    if placeholder == "":
-                        path_args.append(args[args_in_path])
-                    else:
-                        path_kwargs[placeholder] = args[args_in_path]
-
-                    args_in_path += 1
+        path_values = []
+        for placeholder in self.path_placeholders:
+            if (placeholder != "") and (placeholder in kwargs):
+                path_values.append(kwargs.pop(placeholder))
+            else:
+                if len(args) <= args_in_path:
+                    raise ValidationError(
+                        "Number of given arguments can't be smaller than "
+                        "number of path placeholders"
+                    )
+
+                path_values.append(args[args_in_path])
+                args_in_path += 1
 
         return {
-            "path": self.action.path.format(*path_args, **path_kwargs),
-            "params": self._validate_and_map(
-                self.action.params, args[args_in_path:], kwargs
-            )
-            if self.action.params
+            "path": self._render_path(path_values),
+            "params": self._validate_and_map(params, args[args_in_path:], kwargs)
+            if params
             else {},
-            "data": self._validate_and_map(
-                self.action.data, args[args_in_path:], kwargs
-            )
-            if self.action.data
+            "data": self._validate_and_map(data, args[args_in_path:], kwargs)
+            if data
             else {},
         }
+
+    def _render_path(self, path_values: list[Any]) -> str:
+        path_values = iter(path_values)
+
+        return "".join(
+            literal_text
+            if field_name is None
+            else f"{literal_text}{next(path_values)}"
+            for literal_text, field_name in self.path_segments
+        )
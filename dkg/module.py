@@ -15,8 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 
-from dataclasses import asdict
-from typing import Any, Callable, Sequence
+from typing import Any, Callable
 
 from dkg.exceptions import ValidationError
 from dkg.manager import DefaultRequestManager
@@ -30,18 +29,19 @@ class Module:
     def retrieve_caller_fn(
         self, method: Method[Callable[..., TReturn]]
     ) -> Callable[..., TReturn]:
+        action_params, request_type = vars(method.action), method.request_type
+        process_args = method.process_args
+
         def caller(*args: Any, **kwargs: Any) -> TReturn:
-            processed_args = method.process_args(*args, **kwargs)
-            request_params = asdict(method.action)
-            request_params.update(processed_args)
+            request_params = {**action_params, **process_args(*args, **kwargs)}
 
-            return self.manager.blocking_request(type(method.action), request_params)
+            return self.manager.blocking_request(request_type, request_params)
 
         return caller
 
     def _attach_modules(self, module_definitions: dict[str, Any]) -> None:
         for module_name, module_info in module_definitions.items():
-            module_info_is_list_like = isinstance(module_info, Sequence)
+            module_info_is_list_like = isinstance(module_info, (tuple, list))
 
             module = module_info[0] if module_info_is_list_like else module_info
 
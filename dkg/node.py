@@ -19,6 +19,7 @@ from dkg.dataclasses import NodeResponseDict
 from dkg.manager import DefaultRequestManager
 from dkg.method import Method
 from dkg.module import Module
+from dkg.utils.decorators import single_flight
 from dkg.utils.node_request import NodeRequest
 
 
@@ -29,5 +30,6 @@ class Node(Module):
     _info = Method(NodeRequest.info)
 
     @property
+    @single_flight(ttl=5)
     def info(self) -> NodeResponseDict:
         return self._info()
@@ -15,10 +15,15 @@
 # specific language governing permissions and limitations
 # under the License.
 
-import json
-
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from decimal import Decimal
+from functools import lru_cache
+
 from web3 import Web3
+from web3.constants import ADDRESS_ZERO
+from web3.exceptions import ContractLogicError
 from web3.types import TxReceipt
 
 from dkg.dataclasses import BaseIncentivesPoolParams, ParanetIncentivizationType
@@ -27,30 +32,72 @@ from dkg.method import Method
 from dkg.module import Module
 from dkg.types import Address, UAL, HexStr
 from dkg.utils.blockchain_request import BlockchainRequest
+from dkg.utils.decorators import single_flight
+from dkg.utils.receipt import receipt_to_dict
 from dkg.utils.ual import parse_ual
 from dkg.constants import NEUROWEB_BLOCKCHAIN_PREFIX, INCENTIVE_POOL_NAME
 
+OWNER_CACHE_TTL = 15
+INCENTIVES_POOL_CACHE_TTL = 300
+
+_REWARD_AMOUNT_METHODS = {
+    "knowledgeMiner": "_get_claimable_knowledge_miner_reward_amount",
+    "allKnowledgeMiners": "_get_claimable_all_knowledge_miners_reward_amount",
+    "paranetOperator": "_get_claimable_paranet_operator_reward_amount",
+    "proposalVoter": "_get_claimable_proposal_voter_reward_amount",
+    "allProposalVoters": "_get_claimable_all_proposal_voters_reward_amount",
+}
+_reward_amount_executor = ThreadPoolExecutor(max_workers=len(_REWARD_AMOUNT_METHODS))
+
+
+def _paranet_id(
+    knowledge_asset_storage: Address, knowledge_asset_token_id: int
+) -> bytes:
+    return Web3.keccak(
+        bytes.fromhex(knowledge_asset_storage[2:])
+        + knowledge_asset_token_id.to_bytes(32, "big")
+    )
+
+
+@lru_cache(maxsize=4096)
+def _ual_to_ids(ual: UAL) -> tuple[Address, int, bytes, HexStr]:
+    parsed_ual = parse_ual(ual)
+    knowledge_asset_storage, knowledge_asset_token_id = (
+        parsed_ual["contract_address"],
+        parsed_ual["token_id"],
+    )
+    paranet_id = _paranet_id(knowledge_asset_storage, knowledge_asset_token_id)
+
+    return (
+        knowledge_asset_storage,
+        knowledge_asset_token_id,
+        paranet_id,
+        Web3.to_hex(paranet_id),
+    )
+
 
 class Paranet(Module):
-    @dataclass
+    @dataclass(slots=True)
     class NeuroWebIncentivesPoolParams(BaseIncentivesPoolParams):
-        neuro_emission_multiplier: float
-        operator_percentage: float
-        voters_percentage: float
+        neuro_emission_multiplier: float | Decimal
+        operator_percentage: float | Decimal
+        voters_percentage: float | Decimal
 
         def to_contract_args(self, incentive_type: ParanetIncentivizationType | None) -> dict:
             return {
                 "tracToNeuroEmissionMultiplier": int(
-                    self.neuro_emission_multiplier
+                    Decimal(str(self.neuro_emission_multiplier))
                     * (
                         10**12
                         if incentive_type == ParanetIncentivizationType.NEUROWEB
                         else 10**18
                     )
                 ),
-                "paranetOperatorRewardPercentage": int(self.operator_percentage * 100),
+                "paranetOperatorRewardPercentage": int(
+                    Decimal(str(self.operator_percentage)) * 100
+                ),
                 "paranetIncentivizationProposalVotersRewardPercentage": int(
-                    self.voters_percentage * 100
+                    Decimal(str(self.voters_percentage)) * 100
                 ),
             }
 
@@ -60,17 +107,22 @@ class Paranet(Module):
             ParanetIncentivizationType.NEUROWEB: self._deploy_neuro_incentives_pool,
             ParanetIncentivizationType.NEUROWEB_ERC20: self._deploy_neuro_incentives_pool,
         }
+        self._incentives_pool_addresses: dict[
+            tuple[UAL, str], tuple[Address, float]
+        ] = {}
+        self._owners: dict[int, tuple[Address, float]] = {}
 
     _register_paranet = Method(BlockchainRequest.register_paranet)
 
     def create(
         self, ual: UAL, name: str, description: str
     ) -> dict[str, str | HexStr | TxReceipt]:
-        parsed_ual = parse_ual(ual)
-        knowledge_asset_storage, knowledge_asset_token_id = (
-            parsed_ual["contract_address"],
-            parsed_ual["token_id"],
-        )
+        (
+            knowledge_asset_storage,
+            knowledge_asset_token_id,
+            _,
+            paranet_id_hex,
+        ) = _ual_to_ids(ual)
 
         receipt: TxReceipt = self._register_paranet(
             knowledge_asset_storage,
@@ -81,13 +133,8 @@ class Paranet(Module):
 
         return {
             "paranetUAL": ual,
-            "paranetId": Web3.to_hex(
-                Web3.solidity_keccak(
-                    ["address", "uint256"],
-                    [knowledge_asset_storage, knowledge_asset_token_id],
-                )
-            ),
-            "operation": json.loads(Web3.to_json(receipt)),
+            "paranetId": paranet_id_hex,
+            "operation": receipt_to_dict(receipt),
         }
 
     _deploy_neuro_incentives_pool = Method(
@@ -111,11 +158,12 @@ class Paranet(Module):
                 f"Incentive Types: {self.incentives_pools_deployment_functions.keys()}"
             )
 
-        parsed_ual = parse_ual(ual)
-        knowledge_asset_storage, knowledge_asset_token_id = (
-            parsed_ual["contract_address"],
-            parsed_ual["token_id"],
-        )
+        (
+            knowledge_asset_storage,
+            knowledge_asset_token_id,
+            _,
+            paranet_id_hex,
+        ) = _ual_to_ids(ual)
 
         receipt: TxReceipt = deploy_incentives_pool_fn(
             incentives_type == ParanetIncentivizationType.NEUROWEB,
@@ -123,6 +171,7 @@ class Paranet(Module):
             knowledge_asset_token_id,
             **incentives_pool_parameters.to_contract_args(incentives_type),
         )
+        self._incentives_pool_addresses.pop((ual, incentives_type), None)
 
         events = self.manager.blockchain_provider.decode_logs_event(
             receipt,
@@ -132,29 +181,18 @@ class Paranet(Module):
 
         return {
             "paranetUAL": ual,
-            "paranetId": Web3.to_hex(
-                Web3.solidity_keccak(
-                    ["address", "uint256"],
-                    [knowledge_asset_storage, knowledge_asset_token_id],
-                )
-            ),
+            "paranetId": paranet_id_hex,
             "incentivesPoolAddress": events[0].args["incentivesPool"]["addr"],
-            "operation": json.loads(Web3.to_json(receipt)),
+            "operation": receipt_to_dict(receipt),
         }
 
     _get_incentives_pool_address = Method(BlockchainRequest.get_incentives_pool_address)
 
+    @single_flight()
     def get_incentives_pool_address(
         self, ual: UAL, incentives_type: ParanetIncentivizationType | None = None
     ) -> Address:
-        parsed_ual = parse_ual(ual)
-        knowledge_asset_storage, knowledge_asset_token_id = (
-            parsed_ual["contract_address"],
-            parsed_ual["token_id"],
-        )
-        paranet_id = Web3.solidity_keccak(
-            ["address", "uint256"], [knowledge_asset_storage, knowledge_asset_token_id]
-        )
+        _, _, paranet_id, _ = _ual_to_ids(ual)
 
         return self._get_incentives_pool_address(paranet_id, incentives_type)
 
@@ -163,11 +201,12 @@ class Paranet(Module):
     def create_service(
         self, ual: UAL, name: str, description: str, addresses: list[Address]
     ) -> dict[str, str | HexStr | TxReceipt]:
-        parsed_ual = parse_ual(ual)
-        knowledge_asset_storage, knowledge_asset_token_id = (
-            parsed_ual["contract_address"],
-            parsed_ual["token_id"],
-        )
+        (
+            knowledge_asset_storage,
+            knowledge_asset_token_id,
+            _,
+            paranet_id_hex,
+        ) = _ual_to_ids(ual)
 
         receipt: TxReceipt = self._register_paranet_service(
             knowledge_asset_storage,
@@ -179,13 +218,8 @@ class Paranet(Module):
 
         return {
             "paranetServiceUAL": ual,
-            "paranetServiceId": Web3.to_hex(
-                Web3.solidity_keccak(
-                    ["address", "uint256"],
-                    [knowledge_asset_storage, knowledge_asset_token_id],
-                )
-            ),
-            "operation": json.loads(Web3.to_json(receipt)),
+            "paranetServiceId": paranet_id_hex,
+            "operation": receipt_to_dict(receipt),
         }
 
     _add_paranet_services = Method(BlockchainRequest.add_paranet_services)
@@ -193,26 +227,24 @@ class Paranet(Module):
     def add_services(
         self, ual: UAL, services_uals: list[UAL]
     ) -> dict[str, str | HexStr | TxReceipt]:
-        parsed_paranet_ual = parse_ual(ual)
-        paranet_knowledge_asset_storage, paranet_knowledge_asset_token_id = (
-            parsed_paranet_ual["contract_address"],
-            parsed_paranet_ual["token_id"],
-        )
-
-        parsed_service_uals = []
-        for service_ual in services_uals:
-            parsed_service_ual = parse_ual(service_ual)
-            (service_knowledge_asset_storage, service_knowledge_asset_token_id) = (
-                parsed_service_ual["contract_address"],
-                parsed_service_ual["token_id"],
-            )
-
-            parsed_service_uals.append(
-                {
-                    "knowledgeAssetStorageContract": service_knowledge_asset_storage,
-                    "tokenId": service_knowledge_asset_token_id,
-                }
-            )
+        (
+            paranet_knowledge_asset_storage,
+            paranet_knowledge_asset_token_id,
+            _,
+            paranet_id_hex,
+        ) = _ual_to_ids(ual)
+
+        parsed_service_uals = [
+            {
+                "knowledgeAssetStorageContract": service_knowledge_asset_storage,
+                "tokenId": service_knowledge_asset_token_id,
+            }
+            for (
+                service_knowledge_asset_storage,
+                service_knowledge_asset_token_id,
+                *_,
+            ) in map(_ual_to_ids, services_uals)
+        ]
 
         receipt: TxReceipt = self._add_paranet_services(
             paranet_knowledge_asset_storage,
@@ -222,13 +254,8 @@ class Paranet(Module):
 
         return {
             "paranetUAL": ual,
-            "paranetId": Web3.to_hex(
-                Web3.solidity_keccak(
-                    ["address", "uint256"],
-                    [paranet_knowledge_asset_storage, paranet_knowledge_asset_token_id],
-                )
-            ),
-            "operation": json.loads(Web3.to_json(receipt)),
+            "paranetId": paranet_id_hex,
+            "operation": receipt_to_dict(receipt),
         }
 
     _is_knowledge_miner_registered = Method(
@@ -236,15 +263,7 @@ class Paranet(Module):
     )
 
     def is_knowledge_miner(self, ual: UAL, address: Address | None = None) -> bool:
-        parsed_ual = parse_ual(ual)
-        knowledge_asset_storage, knowledge_asset_token_id = (
-            parsed_ual["contract_address"],
-            parsed_ual["token_id"],
-        )
-
-        paranet_id = Web3.solidity_keccak(
-            ["address", "uint256"], [knowledge_asset_storage, knowledge_asset_token_id]
-        )
+        _, _, paranet_id, _ = _ual_to_ids(ual)
 
         return self._is_knowledge_miner_registered(
             paranet_id, address or self.manager.blockchain_provider.account.address
@@ -253,11 +272,17 @@ class Paranet(Module):
     _owner_of = Method(BlockchainRequest.owner_of)
 
     def is_operator(self, ual: UAL, address: Address | None = None) -> bool:
-        knowledge_asset_token_id = parse_ual(ual)["token_id"]
+        _, knowledge_asset_token_id, *_ = _ual_to_ids(ual)
+
+        owner, expires_at = self._owners.get(knowledge_asset_token_id, (None, 0))
+        if expires_at <= time.monotonic():
+            owner = self._owner_of(knowledge_asset_token_id)
+            self._owners[knowledge_asset_token_id] = (
+                owner,
+                time.monotonic() + OWNER_CACHE_TTL,
+            )
 
-        return self._owner_of(knowledge_asset_token_id) == (
-            address or self.manager.blockchain_provider.account.address
-        )
+        return owner == (address or self.manager.blockchain_provider.account.address)
 
     _is_proposal_voter = Method(BlockchainRequest.is_proposal_voter)
 
@@ -335,21 +360,12 @@ class Paranet(Module):
             contract=self._get_incentives_pool_contract(ual, incentives_type)
         )
 
-        parsed_ual = parse_ual(ual)
-        knowledge_asset_storage, knowledge_asset_token_id = (
-            parsed_ual["contract_address"],
-            parsed_ual["token_id"],
-        )
+        *_, paranet_id_hex = _ual_to_ids(ual)
 
         return {
             "paranetUAL": ual,
-            "paranetId": Web3.to_hex(
-                Web3.solidity_keccak(
-                    ["address", "uint256"],
-                    [knowledge_asset_storage, knowledge_asset_token_id],
-                )
-            ),
-            "operation": json.loads(Web3.to_json(receipt)),
+            "paranetId": paranet_id_hex,
+            "operation": receipt_to_dict(receipt),
         }
 
     _get_claimable_paranet_operator_reward_amount = Method(
@@ -390,21 +406,12 @@ class Paranet(Module):
             contract=self._get_incentives_pool_contract(ual, incentives_type)
         )
 
-        parsed_ual = parse_ual(ual)
-        knowledge_asset_storage, knowledge_asset_token_id = (
-            parsed_ual["contract_address"],
-            parsed_ual["token_id"],
-        )
+        *_, paranet_id_hex = _ual_to_ids(ual)
 
         return {
             "paranetUAL": ual,
-            "paranetId": Web3.to_hex(
-                Web3.solidity_keccak(
-                    ["address", "uint256"],
-                    [knowledge_asset_storage, knowledge_asset_token_id],
-                )
-            ),
-            "operation": json.loads(Web3.to_json(receipt)),
+            "paranetId": paranet_id_hex,
+            "operation": receipt_to_dict(receipt),
         }
 
     _get_claimable_proposal_voter_reward_amount = Method(
@@ -445,6 +452,27 @@ class Paranet(Module):
             contract=self._get_incentives_pool_contract(ual, incentives_type)
         )
 
+    def get_all_reward_amounts(
+        self,
+        ual: UAL,
+        incentives_type: ParanetIncentivizationType | None = None,
+    ) -> dict[str, int | None]:
+        incentives_type = incentives_type or (
+            ParanetIncentivizationType.NEUROWEB.value
+            if NEUROWEB_BLOCKCHAIN_PREFIX in ual
+            else ParanetIncentivizationType.NEUROWEB_ERC20.value
+        )
+        contract = self._get_incentives_pool_contract(ual, incentives_type)
+
+        reward_amounts = {
+            role: _reward_amount_executor.submit(
+                self._get_reward_amount, method_name, contract
+            )
+            for role, method_name in _REWARD_AMOUNT_METHODS.items()
+        }
+
+        return {role: future.result() for role, future in reward_amounts.items()}
+
     _claim_incentivization_proposal_voter_reward = Method(
         BlockchainRequest.claim_incentivization_proposal_voter_reward
     )
@@ -464,21 +492,12 @@ class Paranet(Module):
             contract=self._get_incentives_pool_contract(ual, incentives_type)
         )
 
-        parsed_ual = parse_ual(ual)
-        knowledge_asset_storage, knowledge_asset_token_id = (
-            parsed_ual["contract_address"],
-            parsed_ual["token_id"],
-        )
+        *_, paranet_id_hex = _ual_to_ids(ual)
 
         return {
             "paranetUAL": ual,
-            "paranetId": Web3.to_hex(
-                Web3.solidity_keccak(
-                    ["address", "uint256"],
-                    [knowledge_asset_storage, knowledge_asset_token_id],
-                )
-            ),
-            "operation": json.loads(Web3.to_json(receipt)),
+            "paranetId": paranet_id_hex,
+            "operation": receipt_to_dict(receipt),
         }
 
     _get_updating_knowledge_asset_states = Method(
@@ -489,15 +508,12 @@ class Paranet(Module):
     )
 
     def update_claimable_rewards(self, ual: UAL) -> dict[str, str | HexStr | TxReceipt]:
-        parsed_ual = parse_ual(ual)
-        knowledge_asset_storage, knowledge_asset_token_id = (
-            parsed_ual["contract_address"],
-            parsed_ual["token_id"],
-        )
-
-        paranet_id = Web3.solidity_keccak(
-            ["address", "uint256"], [knowledge_asset_storage, knowledge_asset_token_id]
-        )
+        (
+            knowledge_asset_storage,
+            knowledge_asset_token_id,
+            paranet_id,
+            _,
+        ) = _ual_to_ids(ual)
 
         updating_states = self._get_updating_knowledge_asset_states(
             self.manager.blockchain_provider.account.address,
@@ -513,22 +529,45 @@ class Paranet(Module):
         return {
             "paranetUAL": ual,
             "paranetId": paranet_id,
-            "operation": json.loads(Web3.to_json(receipt)),
+            "operation": receipt_to_dict(receipt),
         }
 
+    def _get_reward_amount(
+        self, method_name: str, contract: str | dict[str, str]
+    ) -> int | None:
+        try:
+            return getattr(self, method_name)(contract=contract)
+        except ContractLogicError:
+            return None
+
     def _get_incentives_pool_contract(
         self, ual: UAL, incentives_type: ParanetIncentivizationType
     ) -> str | dict[str, str]:
         incentives_pool_name = INCENTIVE_POOL_NAME
-        is_incentives_pool_cached = (
-            incentives_pool_name in self.manager.blockchain_provider.contracts.keys()
+
+        cache_key = (ual, incentives_type)
+        incentives_pool_address, expires_at = self._incentives_pool_addresses.get(
+            cache_key, (None, 0)
         )
+        if expires_at <= time.monotonic():
+            incentives_pool_address = self.get_incentives_pool_address(
+                ual, incentives_type
+            )
+            if incentives_pool_address and incentives_pool_address != ADDRESS_ZERO:
+                self._incentives_pool_addresses[cache_key] = (
+                    incentives_pool_address,
+                    time.monotonic() + INCENTIVES_POOL_CACHE_TTL,
+                )
+            else:
+                self._incentives_pool_addresses.pop(cache_key, None)
 
-        return (
+        cached_contract = self.manager.blockchain_provider.contracts.get(
             incentives_pool_name
-            if is_incentives_pool_cached
-            else {
-                "name": incentives_pool_name,
-                "address": self.get_incentives_pool_address(ual, incentives_type),
-            }
         )
+        if (
+            cached_contract is not None
+            and cached_contract.address == incentives_pool_address
+        ):
+            return incentives_pool_name
+
+        return {"name": incentives_pool_name, "address": incentives_pool_address}
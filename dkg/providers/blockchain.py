@@ -15,87 +15,200 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import itertools
 import json
 import os
+import time
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import wraps
 from pathlib import Path
-from typing import Any, Type
+from typing import Any, Callable, Type
 
 import requests
-from dkg.constants import BLOCKCHAINS, DEFAULT_GAS_PRICE_GWEI
+from dkg.constants import (
+    BLOCKCHAINS,
+    DEFAULT_GAS_PRICE_GWEI,
+    DEFAULT_RECEIPT_POLL_LATENCY,
+    RECEIPT_POLL_LATENCY,
+    get_blockchain,
+)
 from dkg.exceptions import (
     AccountMissing,
     EnvironmentNotSupported,
     NetworkNotSupported,
+    RPCEndpointsUnavailable,
     RPCURINotDefined,
 )
 from dkg.types import URI, Address, DataHexStr, Environment, Wei
 from eth_account.signers.local import LocalAccount
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from web3 import Web3
 from web3.contract import Contract
 from web3.contract.contract import ContractFunction
 from web3.logs import DISCARD
 from web3.middleware import construct_sign_and_send_raw_middleware
-from web3.types import ABI, ABIFunction, TxReceipt
+from web3.providers import BaseProvider, HTTPProvider
+from web3.types import ABI, ABIFunction, RPCEndpoint, RPCResponse, TxReceipt
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_gas_price_executor = ThreadPoolExecutor(max_workers=8)
+
+_CONTRACT_ERROR_MARKERS = ("revert", "VM Exception")
+
+
+def _is_contract_error(err: Exception) -> bool:
+    message = (
+        err.args[0]
+        if len(err.args) == 1 and isinstance(err.args[0], str)
+        else str(err)
+    )
+
+    return any(marker in message for marker in _CONTRACT_ERROR_MARKERS)
+
+
+class RoundRobinHTTPProvider(BaseProvider):
+    READ_ONLY_METHODS = frozenset(
+        {"eth_call", "eth_chainId", "eth_blockNumber", "eth_gasPrice"}
+    )
+    RATE_LIMITED_COOLDOWN = 30
+
+    def __init__(self, providers: list[HTTPProvider]):
+        self.providers = providers
+        self._indices = itertools.cycle(range(len(providers)))
+        self._rate_limited_until = [0.0] * len(providers)
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        return self._send(
+            lambda provider: provider.make_request(method, params),
+            method in self.READ_ONLY_METHODS,
+        )
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        if any(provider.is_connected() for provider in self.providers):
+            return True
+
+        return show_traceback and self.providers[0].is_connected(show_traceback)
+
+    def _send(self, send: Callable[[HTTPProvider], Any], read_only: bool) -> Any:
+        start = next(self._indices) if read_only else 0
+        indices = [
+            (start + offset) % len(self.providers)
+            for offset in range(len(self.providers))
+        ]
+
+        connection_error = None
+        now = time.monotonic()
+        for index in indices:
+            if self._rate_limited_until[index] > now:
+                continue
+
+            try:
+                return send(self.providers[index])
+            except requests.HTTPError as err:
+                if err.response is None or err.response.status_code != 429:
+                    raise
+                self._rate_limited_until[index] = now + self.RATE_LIMITED_COOLDOWN
+            except requests.ConnectionError as err:
+                if not read_only:
+                    raise
+                connection_error = err
+
+        if connection_error is not None:
+            raise connection_error
+
+        raise RPCEndpointsUnavailable(
+            "All RPC endpoints are rate limited, next one is available in "
+            f"{min(self._rate_limited_until) - now:.1f}s."
+        )
 
 
 class BlockchainProvider:
     CONTRACTS_METADATA_DIR = Path(__file__).parents[1] / "data/interfaces"
+    NETWORK_GAS_PRICE_TTL = 10
+    GAS_PRICE_ORACLE_TIMEOUT = 1.5
+
+    _contract_addresses: dict[tuple[str, Address, str], Address | None] = {}
+    _abis: dict[Path, ABI] = {}
+    _output_named_tuples: dict[Path, dict[str, dict[str, Type[tuple]]]] = {}
 
     def __init__(
         self,
         environment: Environment,
         blockchain_id: str,
-        rpc_uri: URI | None = None,
+        rpc_uri: URI | list[URI] | None = None,
         private_key: DataHexStr | None = None,
         gas_price: Wei | None = None,
         verify: bool = True,
+        session: requests.Session | None = None,
     ):
-        if environment not in BLOCKCHAINS.keys():
+        if environment not in BLOCKCHAINS:
             raise EnvironmentNotSupported(f"Environment {environment} isn't supported!")
 
         self.environment = environment
         self.rpc_uri = rpc_uri
-        self.blockchain_id = (
-            blockchain_id
-            if blockchain_id in BLOCKCHAINS[self.environment].keys()
-            else None
-        )
 
-        if self.rpc_uri is None and self.blockchain_id is not None:
-            self.blockchain_id = blockchain_id
-            self.rpc_uri = self.rpc_uri or BLOCKCHAINS[self.environment][
-                self.blockchain_id
-            ].get("rpc", None)
+        blockchain = get_blockchain(self.environment, blockchain_id)
+        self.blockchain_id = blockchain_id if blockchain is not None else None
+
+        if self.rpc_uri is None and blockchain is not None:
+            self.rpc_uri = blockchain.get("rpc", None)
 
-        if self.rpc_uri is None:
+        if not self.rpc_uri:
             raise RPCURINotDefined(
                 "No RPC URI provided for unrecognized "
                 f"blockchain ID {self.blockchain_id}"
             )
 
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=64,
+                max_retries=Retry(connect=3, read=False, backoff_factor=0.2),
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+
+        rpc_providers = [
+            Web3.HTTPProvider(uri, request_kwargs={"verify": verify}, session=session)
+            for uri in (
+                self.rpc_uri if isinstance(self.rpc_uri, list) else [self.rpc_uri]
+            )
+        ]
         self.w3 = Web3(
-            Web3.HTTPProvider(self.rpc_uri, request_kwargs={"verify": verify})
+            rpc_providers[0]
+            if len(rpc_providers) == 1
+            else RoundRobinHTTPProvider(rpc_providers)
         )
 
         if self.blockchain_id is None:
             self.blockchain_id = f"{blockchain_id}:{self.w3.eth.chain_id}"
-            if self.blockchain_id not in BLOCKCHAINS[self.environment]:
+            blockchain = get_blockchain(self.environment, self.blockchain_id)
+            if blockchain is None:
                 raise NetworkNotSupported(
                     f"Network with blockchain ID {self.blockchain_id} isn't supported!"
                 )
 
+        self._contract_functions: dict[tuple[str, str], Type[ContractFunction]] = {}
+
         self.gas_price = gas_price
-        self.gas_price_oracle = BLOCKCHAINS[self.environment][self.blockchain_id].get(
-            "gas_price_oracle",
-            None,
+        self._network_gas_price: tuple[Wei | None, float] = (None, 0)
+        self.receipt_poll_latency = RECEIPT_POLL_LATENCY.get(
+            self.blockchain_id.split(":")[0], DEFAULT_RECEIPT_POLL_LATENCY
         )
+        self.gas_price_oracle = blockchain.get("gas_price_oracle", None)
 
         self.abi = self._load_abi()
         self.output_named_tuples = self._generate_output_named_tuples()
 
-        hub_address: Address = BLOCKCHAINS[self.environment][self.blockchain_id]["hub"]
+        hub_address: Address = blockchain["hub"]
         self.contracts: dict[str, Contract] = {
             "Hub": self.w3.eth.contract(
                 address=hub_address,
@@ -131,7 +244,7 @@ class BlockchainProvider:
                 if (
                     contract_name
                     and isinstance(contract_name, str)
-                    and any(msg in str(err) for msg in ["revert", "VM Exception"])
+                    and _is_contract_error(err)
                     and not self._check_contract_status(contract_name)
                 ):
                     is_updated = self._update_contract_instance(contract_name)
@@ -163,12 +276,12 @@ class BlockchainProvider:
             )
             self.contracts[contract_name] = contract_instance
 
-        contract_function: ContractFunction = getattr(
-            contract_instance.functions, function
-        )
+        contract_function = self._get_contract_function(
+            contract_name, contract_instance, function
+        )(**args)
 
         if not state_changing:
-            result = contract_function(**args).call()
+            result = contract_function.call()
             if function in (
                 output_named_tuples := self.output_named_tuples[contract_name]
             ):
@@ -181,15 +294,23 @@ class BlockchainProvider:
                     "account."
                 )
 
-            gas_price = self.gas_price or gas_price or self._get_network_gas_price()
+            gas_price = self.gas_price or gas_price
+            network_gas_price = (
+                _gas_price_executor.submit(self._get_network_gas_price)
+                if not gas_price
+                else None
+            )
+            gas_limit = gas_limit or contract_function.estimate_gas()
 
             options = {
-                "gasPrice": gas_price,
-                "gas": gas_limit or contract_function(**args).estimate_gas(),
+                "gasPrice": gas_price or network_gas_price.result(),
+                "gas": gas_limit,
             }
 
-            tx_hash = contract_function(**args).transact(options)
-            tx_receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+            tx_hash = contract_function.transact(options)
+            tx_receipt = self.w3.eth.wait_for_transaction_receipt(
+                tx_hash, poll_latency=self.receipt_poll_latency
+            )
 
             return tx_receipt
 
@@ -209,7 +330,33 @@ class BlockchainProvider:
         )
         self.w3.eth.default_account = self.account.address
 
+    def _get_contract_function(
+        self, contract_name: str, contract_instance: Contract, function: str
+    ) -> Type[ContractFunction]:
+        contract_function = self._contract_functions.get((contract_name, function))
+        if (
+            contract_function is None
+            or contract_function.address != contract_instance.address
+        ):
+            contract_function = getattr(contract_instance.functions, function)
+            self._contract_functions[(contract_name, function)] = contract_function
+
+        return contract_function
+
     def _get_network_gas_price(self) -> Wei | None:
+        gas_price, expires_at = self._network_gas_price
+        if expires_at > time.monotonic():
+            return gas_price
+
+        gas_price = self._fetch_network_gas_price()
+        self._network_gas_price = (
+            gas_price,
+            time.monotonic() + self.NETWORK_GAS_PRICE_TTL,
+        )
+
+        return gas_price
+
+    def _fetch_network_gas_price(self) -> Wei | None:
         if self.environment == "development":
             return None
 
@@ -221,7 +368,9 @@ class BlockchainProvider:
 
         def fetch_gas_price(oracle_url: str) -> Wei | None:
             try:
-                response = requests.get(oracle_url)
+                response = requests.get(
+                    oracle_url, timeout=self.GAS_PRICE_ORACLE_TIMEOUT
+                )
                 response.raise_for_status()
                 data: dict = response.json()
 
@@ -239,10 +388,16 @@ class BlockchainProvider:
             if isinstance(oracles, str):
                 oracles = [oracles]
 
-            for oracle_url in oracles:
-                gas_price = fetch_gas_price(oracle_url)
-                if gas_price is not None:
-                    return gas_price
+            executor = ThreadPoolExecutor(max_workers=len(oracles))
+            try:
+                for future in as_completed(
+                    executor.submit(fetch_gas_price, oracle_url)
+                    for oracle_url in oracles
+                ):
+                    if (gas_price := future.result()) is not None:
+                        return gas_price
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
 
         return default_gas_price
 
@@ -251,28 +406,43 @@ class BlockchainProvider:
             if contract == "Hub":
                 continue
 
-            self._update_contract_instance(contract)
+            self._update_contract_instance(contract, use_cache=True)
+
+    def _update_contract_instance(self, contract: str, use_cache: bool = False) -> bool:
+        contract_address = self._get_contract_address(contract, use_cache)
+        if contract_address is None:
+            return False
+
+        self.contracts[contract] = self.w3.eth.contract(
+            address=contract_address,
+            abi=self.abi[contract],
+            decode_tuples=True,
+        )
+        return True
+
+    def _get_contract_address(
+        self, contract: str, use_cache: bool = False
+    ) -> Address | None:
+        hub = self.contracts["Hub"]
+        cache_key = (self.blockchain_id, hub.address, contract)
+
+        if use_cache and cache_key in self._contract_addresses:
+            return self._contract_addresses[cache_key]
 
-    def _update_contract_instance(self, contract: str) -> bool:
         if (
-            self.contracts["Hub"].functions.isContract(contractName=contract).call()
-            or self.contracts["Hub"]
-            .functions.isAssetStorage(assetStorageName=contract)
-            .call()
+            hub.functions.isContract(contractName=contract).call()
+            or hub.functions.isAssetStorage(assetStorageName=contract).call()
         ):
-            self.contracts[contract] = self.w3.eth.contract(
-                address=(
-                    self.contracts["Hub"].functions.getContractAddress(contract).call()
-                    if not contract.endswith("AssetStorage")
-                    else self.contracts["Hub"]
-                    .functions.getAssetStorageAddress(contract)
-                    .call()
-                ),
-                abi=self.abi[contract],
-                decode_tuples=True,
+            contract_address = (
+                hub.functions.getContractAddress(contract).call()
+                if not contract.endswith("AssetStorage")
+                else hub.functions.getAssetStorageAddress(contract).call()
             )
-            return True
-        return False
+        else:
+            contract_address = None
+
+        self._contract_addresses[cache_key] = contract_address
+        return contract_address
 
     def _check_contract_status(self, contract: str) -> bool:
         try:
@@ -287,6 +457,12 @@ class BlockchainProvider:
                 return namedtuple(f"{function_abi['name']}Result", output_names)
             return None
 
+        output_named_tuples = self._output_named_tuples.get(
+            self.CONTRACTS_METADATA_DIR
+        )
+        if output_named_tuples is not None:
+            return output_named_tuples
+
         output_named_tuples = {}
         for contract_name, contract_abi in self.abi.items():
             output_named_tuples[contract_name] = {}
@@ -299,13 +475,21 @@ class BlockchainProvider:
                 if named_tuple is not None:
                     output_named_tuples[contract_name][item["name"]] = named_tuple
 
+        self._output_named_tuples[self.CONTRACTS_METADATA_DIR] = output_named_tuples
         return output_named_tuples
 
     def _load_abi(self) -> ABI:
+        if (abi := self._abis.get(self.CONTRACTS_METADATA_DIR)) is not None:
+            return abi
+
         abi = {}
 
         for contract_metadata in self.CONTRACTS_METADATA_DIR.glob("*.json"):
-            with open(contract_metadata, "r") as metadata_json:
-                abi[contract_metadata.stem] = json.load(metadata_json)
+            abi[contract_metadata.stem] = (
+                orjson.loads(contract_metadata.read_bytes())
+                if orjson is not None
+                else json.loads(contract_metadata.read_text())
+            )
 
+        self._abis[self.CONTRACTS_METADATA_DIR] = abi
         return abi
@@ -21,8 +21,14 @@ import requests
 from dkg.dataclasses import HTTPRequestMethod, NodeResponseDict
 from dkg.exceptions import HTTPRequestMethodNotSupported, NodeRequestError
 from dkg.types import URI
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError, ConnectionError, Timeout, RequestException
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class NodeHTTPProvider:
     def __init__(
@@ -35,6 +41,11 @@ class NodeHTTPProvider:
         self.auth_token = auth_token
         self.api_version = api_version
 
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
     def get_full_url(self, path: str) -> str:
         return f"{self.endpoint_uri}/{self.api_version}/{path}"
 
@@ -52,9 +63,9 @@ class NodeHTTPProvider:
 
         try:
             if method == HTTPRequestMethod.GET:
-                response = requests.get(url, params=params, headers=headers)
+                response = self.session.get(url, params=params, headers=headers)
             elif method == HTTPRequestMethod.POST:
-                response = requests.post(url, json=data, headers=headers)
+                response = self.session.post(url, json=data, headers=headers)
             else:
                 raise HTTPRequestMethodNotSupported(
                     f"{method.name} method isn't supported"
@@ -63,7 +74,11 @@ class NodeHTTPProvider:
             response.raise_for_status()
 
             try:
-                return NodeResponseDict(response.json())
+                return NodeResponseDict(
+                    orjson.loads(response.content)
+                    if orjson is not None
+                    else response.json()
+                )
             except ValueError as err:
                 raise NodeRequestError(f"JSON decoding failed: {err}")
 
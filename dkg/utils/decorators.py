@@ -15,27 +15,73 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import asyncio
+import copy
+import inspect
+import random
+import threading
 import time
+from concurrent.futures import Future
 from functools import wraps
-from typing import Any, Callable
+from typing import Any, Callable, Hashable, Iterator
+from weakref import WeakKeyDictionary
 
-from dkg.exceptions import NodeRequestError
+from dkg.exceptions import NodeRequestError, OperationNotFinished
+
+
+def _retry_delays(
+    max_retries: int,
+    base_delay: float,
+    backoff: float,
+    max_delay: float | None,
+    jitter: float,
+) -> Iterator[float]:
+    _delay = base_delay
+
+    for _ in range(max_retries):
+        if max_delay is not None:
+            _delay = min(_delay, max_delay)
+
+        yield _delay * random.uniform(1 - jitter, 1 + jitter)
+        _delay *= backoff
 
 
 def retry(
-    catch: Exception, max_retries: int, base_delay: int, backoff: float
+    catch: Exception,
+    max_retries: int,
+    base_delay: float,
+    backoff: float,
+    max_delay: float | None = None,
+    jitter: float = 0,
 ) -> Callable[[Callable], Callable]:
     def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                for delay in _retry_delays(
+                    max_retries, base_delay, backoff, max_delay, jitter
+                ):
+                    try:
+                        return await func(*args, **kwargs)
+                    except catch:
+                        await asyncio.sleep(delay)
+
+                raise NodeRequestError(
+                    f"Failed executing {func.__name__} after {max_retries} retries."
+                )
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            _delay = base_delay
-
-            for _ in range(max_retries):
+            for delay in _retry_delays(
+                max_retries, base_delay, backoff, max_delay, jitter
+            ):
                 try:
                     return func(*args, **kwargs)
                 except catch:
-                    time.sleep(_delay)
-                    _delay *= backoff
+                    time.sleep(delay)
 
             raise NodeRequestError(
                 f"Failed executing {func.__name__} after {max_retries} retries."
@@ -44,3 +90,72 @@ def retry(
         return wrapper
 
     return decorator
+
+
+retry_operation_result = retry(
+    catch=OperationNotFinished,
+    max_retries=35,
+    base_delay=0.05,
+    backoff=2,
+    max_delay=1,
+    jitter=0.2,
+)
+
+
+def single_flight(ttl: float = 0) -> Callable[[Callable], Callable]:
+    def decorator(func: Callable) -> Callable:
+        lock = threading.Lock()
+        instance_states: WeakKeyDictionary[
+            Any, tuple[dict[Hashable, Future], dict[Hashable, tuple[Any, float]]]
+        ] = WeakKeyDictionary()
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs) -> Any:
+            try:
+                key = (args, frozenset(kwargs.items()))
+                hash(key)
+            except TypeError:
+                return func(self, *args, **kwargs)
+
+            with lock:
+                in_flight, results = instance_states.setdefault(self, ({}, {}))
+
+                cached = results.get(key)
+                if cached is not None and cached[1] > time.monotonic():
+                    return copy.deepcopy(cached[0])
+
+                future = in_flight.get(key)
+                is_leader = future is None
+                if is_leader:
+                    future = in_flight[key] = Future()
+
+            if not is_leader:
+                return copy.deepcopy(future.result())
+
+            try:
+                result = func(self, *args, **kwargs)
+            except Exception as err:
+                with lock:
+                    del in_flight[key]
+                future.set_exception(err)
+                raise
+
+            shared_result = copy.deepcopy(result)
+            with lock:
+                del in_flight[key]
+                if ttl > 0:
+                    now = time.monotonic()
+                    for expired_key in [
+                        cached_key
+                        for cached_key, (_, expires_at) in results.items()
+                        if expires_at <= now
+                    ]:
+                        del results[expired_key]
+                    results[key] = (shared_result, now + ttl)
+            future.set_result(shared_result)
+
+            return result
+
+        return wrapper
+
+    return decorator
@@ -24,7 +24,9 @@ from eth_abi.packed import encode_packed
 
 def generate_assertion_metadata(assertion: NQuads) -> dict[str, int]:
     return {
-        "size": len(json.dumps(assertion, separators=(",", ":")).encode("utf-8")),
+        # json.dumps escapes non-ASCII characters by default, so the length of the
+        # serialized string already equals its UTF-8 byte size.
+        "size": len(json.dumps(assertion, separators=(",", ":"))),
         "triples_number": len(assertion),
         "chunks_number": len(assertion),  # TODO: Change when chunking introduced
     }
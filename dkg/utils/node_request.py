@@ -176,19 +176,24 @@ class OperationStatus(AutoStrEnumUpperCase):
     QUERY = QueryOperationStatus
 
 
+def _raise_operation_failed(operation_result: dict[str, Any]) -> None:
+    raise OperationFailed(
+        f"Operation failed! {operation_result['data']['errorType']}: "
+        f"{operation_result['data']['errorMessage']}."
+    )
+
+
+def _raise_operation_not_finished(operation_result: dict[str, Any]) -> None:
+    raise OperationNotFinished("Operation isn't finished")
+
+
+_OPERATION_STATUS_HANDLERS = {
+    OperationStatus.COMPLETED.value: lambda operation_result: None,
+    OperationStatus.FAILED.value: _raise_operation_failed,
+}
+
+
 def validate_operation_status(operation_result: dict[str, Any]) -> None:
-    try:
-        status = OperationStatus(operation_result["status"])
-    except ValueError:
-        raise OperationNotFinished("Operation isn't finished")
-
-    match status:
-        case OperationStatus.COMPLETED:
-            return
-        case OperationStatus.FAILED:
-            raise OperationFailed(
-                f"Operation failed! {operation_result['data']['errorType']}: "
-                f"{operation_result['data']['errorMessage']}."
-            )
-        case _:
-            raise OperationNotFinished("Operation isn't finished")
+    _OPERATION_STATUS_HANDLERS.get(
+        operation_result["status"], _raise_operation_not_finished
+    )(operation_result)
@@ -15,7 +15,12 @@
 # specific language governing permissions and limitations
 # under the License.
 
-from typing import Literal
+import copy
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Literal
 
 from dkg.constants import PRIVATE_ASSERTION_PREDICATE
 from dkg.exceptions import DatasetInputFormatNotSupported, InvalidDataset
@@ -23,28 +28,80 @@ from dkg.types import JSONLD, HexStr, NQuads
 from dkg.utils.merkle import MerkleTree, hash_assertion_with_indexes
 from pyld import jsonld
 
+REMOTE_DOCUMENTS_CACHE_SIZE = 256
+FAILED_REMOTE_DOCUMENT_RETRY_DELAY = 30
+
+_load_remote_document = jsonld.requests_document_loader()
+_remote_documents: OrderedDict[
+    str, tuple[dict[str, Any] | None, Exception | None, float]
+] = OrderedDict()
+_remote_documents_lock = threading.Lock()
+
+
+def _cached_document_loader(
+    url: str, options: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    with _remote_documents_lock:
+        document, error, expires_at = _remote_documents.get(url, (None, None, 0))
+        is_cached = expires_at > time.monotonic()
+        if is_cached:
+            _remote_documents.move_to_end(url)
+
+    if not is_cached:
+        try:
+            document, error, expires_at = (
+                _load_remote_document(url, options or {}),
+                None,
+                math.inf,
+            )
+        except Exception as err:
+            document, error, expires_at = (
+                None,
+                err,
+                time.monotonic() + FAILED_REMOTE_DOCUMENT_RETRY_DELAY,
+            )
+
+        with _remote_documents_lock:
+            _remote_documents[url] = (document, error, expires_at)
+            _remote_documents.move_to_end(url)
+            while len(_remote_documents) > REMOTE_DOCUMENTS_CACHE_SIZE:
+                _remote_documents.popitem(last=False)
+
+    if error is not None:
+        raise error
+
+    return copy.deepcopy(document)
+
+
+_JSONLD_NORMALIZATION_OPTIONS = {
+    "algorithm": "URDNA2015",
+    "format": "application/n-quads",
+    "documentLoader": _cached_document_loader,
+}
+_NQUADS_NORMALIZATION_OPTIONS = {
+    **_JSONLD_NORMALIZATION_OPTIONS,
+    "inputFormat": "application/n-quads",
+}
+_NORMALIZATION_OPTIONS = {
+    "json-ld": _JSONLD_NORMALIZATION_OPTIONS,
+    "jsonld": _JSONLD_NORMALIZATION_OPTIONS,
+    "n-quads": _NQUADS_NORMALIZATION_OPTIONS,
+    "nquads": _NQUADS_NORMALIZATION_OPTIONS,
+}
+
 
 def normalize_dataset(
     dataset: JSONLD | NQuads,
     input_format: Literal["JSON-LD", "N-Quads"] = "JSON-LD",
 ) -> NQuads:
-    normalization_options = {
-        "algorithm": "URDNA2015",
-        "format": "application/n-quads",
-    }
-
-    match input_format.lower():
-        case "json-ld" | "jsonld":
-            pass
-        case "n-quads" | "nquads":
-            normalization_options["inputFormat"] = "application/n-quads"
-        case _:
-            raise DatasetInputFormatNotSupported(
-                f"Dataset input format isn't supported: {input_format}. "
-                "Supported formats: JSON-LD / N-Quads."
-            )
+    normalization_options = _NORMALIZATION_OPTIONS.get(input_format.lower(), None)
+    if normalization_options is None:
+        raise DatasetInputFormatNotSupported(
+            f"Dataset input format isn't supported: {input_format}. "
+            "Supported formats: JSON-LD / N-Quads."
+        )
 
-    n_quads = jsonld.normalize(dataset, normalization_options)
+    n_quads = jsonld.normalize(dataset, dict(normalization_options))
     assertion = [quad for quad in n_quads.split("\n") if quad]
 
     if not assertion:
@@ -53,6 +110,41 @@ def normalize_dataset(
     return assertion
 
 
+def _triple_key(graph_name: str, triple: dict[str, Any]) -> tuple:
+    subject, predicate, object_ = (
+        triple["subject"],
+        triple["predicate"],
+        triple["object"],
+    )
+
+    return (
+        graph_name,
+        subject["type"],
+        subject["value"],
+        predicate["type"],
+        predicate["value"],
+        object_["type"],
+        object_["value"],
+        object_.get("datatype"),
+        object_.get("language"),
+    )
+
+
+def nquads_to_dataset(assertion: NQuads) -> dict[str, list[dict[str, Any]]]:
+    dataset, seen_triples = {}, set()
+
+    for quad in assertion:
+        for graph_name, triples in jsonld.JsonLdProcessor.parse_nquads(quad).items():
+            for triple in triples:
+                if (triple_key := _triple_key(graph_name, triple)) in seen_triples:
+                    continue
+
+                seen_triples.add(triple_key)
+                dataset.setdefault(graph_name, []).append(triple)
+
+    return dataset
+
+
 def format_content(
     content: dict[Literal["public", "private"], JSONLD],
     type: Literal["JSON-LD", "N-Quads"] = "JSON-LD",
@@ -0,0 +1,33 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from collections.abc import Mapping
+from typing import Any
+
+from web3 import Web3
+
+
+def receipt_to_dict(value: Any) -> Any:
+    match value:
+        case Mapping():
+            return {key: receipt_to_dict(item) for key, item in value.items()}
+        case list() | tuple():
+            return [receipt_to_dict(item) for item in value]
+        case bytes():
+            return Web3.to_hex(value)
+        case _:
+            return value
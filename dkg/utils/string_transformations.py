@@ -15,6 +15,10 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1024)
 def snake_to_camel(string: str) -> str:
     splitted_string = string.split("_")
     return splitted_string[0] + "".join(